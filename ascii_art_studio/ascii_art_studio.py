@@ -4,8 +4,13 @@ ASCII Art Studio - A command-line application to convert images to ASCII art.
 This module serves as the main entry point for the application.
 """
 
+import argparse
+import re
+import signal
 import sys
-from ascii_art_studio.cli import CommandExecutor
+from typing import List, Optional
+
+from ascii_art_studio.cli import CommandExecutor, AsyncRepl
 
 
 def print_welcome():
@@ -22,35 +27,69 @@ def print_welcome():
     print(welcome_text)
 
 
-def main():
+def stream_stdin(frame_size: str, frame_mode: str) -> int:
+    """
+    Render raw frames piped to stdin live, e.g. from ffmpeg.
+
+    Args:
+        frame_size: Frame size as '<width>x<height>'
+        frame_mode: 'gray' or 'rgb'
+
+    Returns:
+        The exit status of the application
+    """
+    match = re.match(r'^(\d+)x(\d+)$', frame_size)
+    if not match or frame_mode not in CommandExecutor.STREAM_MODES:
+        print(f"Invalid stream format: {frame_size} {frame_mode}. Expected <width>x<height> [gray|rgb]")
+        return 2
+
+    executor = CommandExecutor()
+    width, height = int(match.group(1)), int(match.group(2))
+
+    # Ctrl+C stops the playback the same way 'cancel' does, so the summary is still printed
+    signal.signal(signal.SIGINT, lambda signum, frame: executor.cancel())
+
+    # Unbuffered view of stdin, so frames are read straight into the stream's buffers
+    with open(sys.stdin.fileno(), 'rb', buffering=0, closefd=False) as source_file:
+        try:
+            print(executor.stream(source_file, width, height, CommandExecutor.STREAM_MODES[frame_mode]))
+        except ValueError as e:
+            print(f"Failed to stream from stdin. Reason: {str(e)}")
+            return 1
+
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for the ASCII Art Studio application.
-    Initializes the application and starts the command loop.
+    Initializes the application and starts the command loop, or renders
+    frames from stdin when started with --stream.
+
+    Args:
+        argv: Command-line arguments, defaults to sys.argv[1:]
+
+    Returns:
+        The exit status of the application
     """
+    arg_parser = argparse.ArgumentParser(prog="ascii-art-studio", description="Convert images to ASCII art.")
+    arg_parser.add_argument("--stream", nargs="+", metavar="WxH [gray|rgb]",
+                            help="render raw frames piped to stdin instead of starting the prompt")
+    args = arg_parser.parse_args(argv)
+
+    if args.stream:
+        if len(args.stream) > 2:
+            arg_parser.error("--stream takes a frame size and an optional mode")
+        return stream_stdin(args.stream[0], args.stream[1].lower() if len(args.stream) > 1 else 'gray')
+
     print_welcome()
     
     # Initialize the command executor
     executor = CommandExecutor()
-    prompt = "AAS> "
     
-    # Main command loop
-    while executor.is_running:
-        try:
-            # Get user input and execute command
-            command = input(prompt)
-            result = executor.execute_command(command)
-            
-            # Print the result if any
-            if result:
-                print(result)
-                
-        except KeyboardInterrupt:
-            # Simple handler for Ctrl+C
-            print("\nTo exit the application, type 'quit' or 'exit'")
-            
-        except Exception as e:
-            # Simple catch-all for any other errors
-            print(f"Error: {str(e)}")
+    # Main command loop: commands run in the background so the prompt stays responsive
+    AsyncRepl(executor, prompt="AAS> ").run()
+    return 0
 
 
 if __name__ == "__main__":
@@ -2,10 +2,11 @@
 Command-line interface modules for ASCII Art Studio.
 
 This package contains modules for parsing and executing commands
-entered by the user.
+entered by the user, and the interactive prompt that reads them.
 """
 
 from .command_parser import CommandParser
 from .command_executor import CommandExecutor
+from .async_repl import AsyncRepl
 
-__all__ = ['CommandParser', 'CommandExecutor']
+__all__ = ['CommandParser', 'CommandExecutor', 'AsyncRepl']
@@ -0,0 +1,223 @@
+"""
+Asynchronous REPL module for ASCII Art Studio.
+
+This module runs the interactive prompt on an asyncio event loop, so the
+prompt stays responsive while commands run in the background.
+"""
+
+import asyncio
+import os
+import signal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+
+from .command_executor import CommandExecutor
+
+
+class AsyncRepl:
+    """
+    Class for the non-blocking read-eval-print loop of ASCII Art Studio.
+
+    Input is read on a background thread and commands are executed one at
+    a time on a worker thread. Commands typed while another one runs are
+    queued, except 'cancel', which stops the running command right away.
+    """
+
+    # Seconds between progress updates
+    PROGRESS_INTERVAL = 0.1
+    PROGRESS_BAR_WIDTH = 30
+
+    # Bytes read at a time from piped input
+    READ_SIZE = 4096
+
+    # ANSI escape sequence returning to the start of the line and clearing it
+    CLEAR_LINE = "\r\x1b[K"
+
+    def __init__(self, executor: CommandExecutor, prompt: str = "AAS> ") -> None:
+        """
+        Initialize the REPL.
+
+        Args:
+            executor (CommandExecutor): Executes the commands entered by the user.
+            prompt (str, optional): The prompt shown for input. Defaults to "AAS> ".
+        """
+        self.executor = executor
+        self.prompt = prompt
+        self.is_busy = False
+        self._cancel_next = False
+        self._interactive = sys.stdout.isatty()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._commands: Optional["asyncio.Queue[Optional[str]]"] = None
+
+    def run(self) -> None:
+        """Run the REPL until the user quits or input ends."""
+        asyncio.run(self._main())
+
+    async def _main(self) -> None:
+        """Read, queue and execute commands until the executor stops running."""
+        self._loop = asyncio.get_running_loop()
+        self._commands = asyncio.Queue()
+
+        # A daemon thread, so a pending read never keeps the application alive
+        threading.Thread(target=self._read_input, daemon=True).start()
+
+        try:
+            self._loop.add_signal_handler(signal.SIGINT, self._handle_interrupt)
+        except (NotImplementedError, AttributeError):
+            # Not available on Windows, Ctrl+C keeps its default behaviour there
+            pass
+
+        with ThreadPoolExecutor(max_workers=1) as worker:
+            while self.executor.is_running:
+                command = await self._commands.get()
+                if command is None:
+                    break
+                await self._run_command(worker, command)
+
+    def _read_input(self) -> None:
+        """Read lines from the user and hand them to the event loop."""
+        lines = self._read_terminal() if sys.stdin.isatty() else self._read_pipe()
+        try:
+            for line in lines:
+                self._loop.call_soon_threadsafe(self._on_input, line)
+            self._loop.call_soon_threadsafe(self._on_input, None)
+        except RuntimeError:
+            # The event loop already closed after 'quit'
+            pass
+
+    def _read_terminal(self) -> Iterator[str]:
+        """
+        Read lines from the terminal with line editing until input ends.
+
+        Yields:
+            str: Each line entered by the user.
+        """
+        while True:
+            try:
+                yield input(self.prompt)
+            except EOFError:
+                return
+
+    def _read_pipe(self) -> Iterator[str]:
+        """
+        Read lines from piped input until it ends.
+
+        The file descriptor is read directly rather than through sys.stdin,
+        so a read still pending when the application exits holds no lock
+        on the stdin buffer, which would abort the interpreter shutdown.
+
+        Yields:
+            str: Each line of input, without the line ending.
+        """
+        fd = sys.stdin.fileno()
+        encoding = sys.stdin.encoding or "utf-8"
+        pending = b""
+        while True:
+            data = os.read(fd, self.READ_SIZE)
+            if not data:
+                break
+
+            *lines, pending = (pending + data).split(b"\n")
+            for line in lines:
+                yield line.decode(encoding, errors="replace").rstrip("\r")
+
+        if pending:
+            yield pending.decode(encoding, errors="replace").rstrip("\r")
+
+    def _on_input(self, line: Optional[str]) -> None:
+        """
+        Handle a line entered by the user.
+
+        Args:
+            line (str, optional): The entered line, or None when input ended.
+        """
+        cmd_type, _ = self.executor.parser.parse_command(line or "")
+
+        # Cancel acts immediately instead of waiting behind the running command
+        if line is not None and cmd_type == 'cancel':
+            if self.is_busy:
+                self.executor.cancel()
+                self._print("Cancelling the running command.")
+            elif not self._commands.empty():
+                # The command about to start is cancelled as soon as it starts
+                self._cancel_next = True
+                self._print("Cancelling the next command.")
+            else:
+                self._print("Nothing to cancel.")
+            return
+
+        if line is not None and (self.is_busy or not self._commands.empty()):
+            self._print(f"Queued: {line.strip()}")
+        self._commands.put_nowait(line)
+
+    async def _run_command(self, worker: ThreadPoolExecutor, command: str) -> None:
+        """
+        Execute a command on the worker thread, showing progress while it runs.
+
+        Args:
+            worker (ThreadPoolExecutor): The thread that executes commands.
+            command (str): The command to execute.
+        """
+        self.is_busy = True
+
+        # Reset on the loop thread before the command starts, so a cancel
+        # handled from here on can never be cleared by the worker
+        self.executor.reset_status()
+        if self._cancel_next:
+            self._cancel_next = False
+            self.executor.cancel()
+
+        future = self._loop.run_in_executor(worker, self.executor.execute_command, command)
+
+        try:
+            while True:
+                done, _ = await asyncio.wait({future}, timeout=self.PROGRESS_INTERVAL)
+                if done:
+                    break
+                self._show_progress()
+            result = future.result()
+        except Exception as e:
+            # Simple catch-all for any other errors
+            result = f"Error: {str(e)}"
+        finally:
+            self.is_busy = False
+
+        if result:
+            self._print(result)
+
+    def _show_progress(self) -> None:
+        """Show the progress of the running conversion on the prompt line."""
+        progress = self.executor.progress
+        if not self._interactive or progress is None:
+            return
+
+        done, total = progress
+        filled = self.PROGRESS_BAR_WIDTH * done // total
+        bar = "=" * filled + " " * (self.PROGRESS_BAR_WIDTH - filled)
+        sys.stdout.write(f"{self.CLEAR_LINE}[{bar}] {100 * done // total}% - type 'cancel' to stop")
+        sys.stdout.flush()
+
+    def _print(self, text: str) -> None:
+        """
+        Print output without mixing it into the pending prompt.
+
+        Args:
+            text (str): The text to print.
+        """
+        if self._interactive:
+            # Replace the pending prompt, then show it again below the output
+            prompt = self.prompt if self.executor.is_running else ""
+            sys.stdout.write(f"{self.CLEAR_LINE}{text}\n{prompt}")
+            sys.stdout.flush()
+        else:
+            print(text)
+
+    def _handle_interrupt(self) -> None:
+        """Handle Ctrl+C: cancel the running command or explain how to exit."""
+        if self.is_busy:
+            self.executor.cancel()
+            self._print("Cancelling the running command.")
+        else:
+            self._print("To exit the application, type 'quit' or 'exit'")
@@ -4,9 +4,12 @@ Command executor module for ASCII Art Studio.
 This module handles executing commands parsed by the command parser.
 """
 
-from typing import Dict, Any
+import shutil
+import threading
+from typing import BinaryIO, Dict, Any, Optional, Tuple
 
-from ascii_art_studio.core import ImageProcessor, AsciiConverter
+from ascii_art_studio.core import (ImageProcessor, AsciiConverter, CharsetCalibrator,
+                                   ConversionCancelled, FrameStream, LiveRenderer)
 from .command_parser import CommandParser
 
 
@@ -18,14 +21,26 @@ class CommandExecutor:
     interacting with the core modules to perform image processing, ASCII
     conversion, and rendering.
     """
+
+    # Maximum width of live stream rendering in characters
+    STREAM_WIDTH = 160
+
+    # Frame modes accepted by the 'stream' command mapped to PIL modes
+    STREAM_MODES = {'gray': 'L', 'rgb': 'RGB'}
     
     def __init__(self):
         """Initialize the command executor with required components."""
         self.image_processor = ImageProcessor()
         self.ascii_converter = AsciiConverter()
+        self.calibrator = CharsetCalibrator()
         self.parser = CommandParser()
         self.is_running = True
         
+        # Shared with the REPL thread: set to stop the running command,
+        # progress holds (rows done, total rows) of the running conversion
+        self.cancel_event = threading.Event()
+        self.progress: Optional[Tuple[int, int]] = None
+        
     def execute_command(self, command_str: str) -> str:
         """
         Execute a command string.
@@ -45,6 +60,9 @@ class CommandExecutor:
             'load': self._execute_load,
             'render': self._execute_render,
             'info': self._execute_info,
+            'stream': self._execute_stream,
+            'calibrate': self._execute_calibrate,
+            'cancel': self._execute_cancel,
             'quit': self._execute_quit,
             'help': self._execute_help,
             'empty': self._execute_empty,
@@ -55,6 +73,30 @@ class CommandExecutor:
         handler = command_methods.get(cmd_type, self._execute_unknown)
         return handler(args)
     
+    def reset_status(self) -> None:
+        """
+        Clear the cancel request and progress left by the previous command.
+        
+        Called by the REPL before it starts a command, from the thread that
+        also handles 'cancel', so a cancel request cannot be lost in between.
+        """
+        self.cancel_event.clear()
+        self.progress = None
+    
+    def cancel(self) -> None:
+        """Ask the running command to stop at its next checkpoint."""
+        self.cancel_event.set()
+    
+    def _update_progress(self, done: int, total: int) -> None:
+        """
+        Record the progress of the running conversion.
+        
+        Args:
+            done: Number of rows converted so far
+            total: Total number of rows
+        """
+        self.progress = (done, total)
+    
     def _execute_load(self, args: Dict[str, Any]) -> str:
         """
         Execute the 'load' command.
@@ -90,11 +132,16 @@ class CommandExecutor:
             # Convert the image to ASCII art with fixed width of 50
             ascii_rows = self.ascii_converter.convert_image(
                 self.image_processor, 
-                width=50  # Fixed width
+                width=50,  # Fixed width
+                edges=args.get('mode') == 'edges',
+                progress=self._update_progress,
+                cancel=self.cancel_event
             )
             
             # Return the rendered ASCII art using the converter
             return self.ascii_converter.render_to_string(ascii_rows)
+        except ConversionCancelled:
+            return "Rendering cancelled."
         except Exception as e:
             return f"Error rendering image: {str(e)}"
     
@@ -116,11 +163,102 @@ class CommandExecutor:
         # Format the information
         lines = [
             f"Filename: {info['filename']}",
-            f"Dimensions: {info['width']}x{info['height']} pixels"
+            f"Dimensions: {info['width']}x{info['height']} pixels",
+            f"Format: {info['format']}",
+            f"Mode: {info['mode']}",
+            f"Frames: {info['frames']}",
+            f"EXIF orientation: {info['orientation']}"
+        ]
+        
+        return "\n".join(lines)
+    
+    def _execute_stream(self, args: Dict[str, Any]) -> str:
+        """
+        Execute the 'stream' command.
+        
+        Args:
+            args: Dictionary containing command arguments
+            
+        Returns:
+            A summary of the stream playback or error message
+        """
+        source = args.get('source')
+        mode = self.STREAM_MODES[args.get('mode', 'gray')]
+        
+        try:
+            # Unbuffered, so frames are read straight into the stream's buffers
+            with open(source, 'rb', buffering=0) as source_file:
+                return self.stream(source_file, int(args['width']), int(args['height']), mode)
+        except (OSError, ValueError) as e:
+            return f"Failed to stream: {source}. Reason: {str(e)}"
+    
+    def stream(self, source_file: BinaryIO, width: int, height: int, mode: str = 'L') -> str:
+        """
+        Render raw frames from an open binary stream live until it ends.
+        
+        Args:
+            source_file: Binary stream to read frames from, e.g. a named pipe or stdin
+            width: Frame width in pixels
+            height: Frame height in pixels
+            mode: PIL mode of the frames, 'L' or 'RGB'
+            
+        Returns:
+            A summary of the stream playback
+            
+        Raises:
+            ValueError: If the frame size or mode is invalid
+        """
+        # Fit the output to the terminal, leaving room for the status line
+        columns = shutil.get_terminal_size().columns
+        output_width = min(self.STREAM_WIDTH, columns)
+        
+        stream = FrameStream(source_file, width, height, mode)
+        stats = LiveRenderer(self.ascii_converter, width=output_width).run(stream, cancel=self.cancel_event)
+        
+        lines = [
+            f"Rendered {stats['rendered']} frames in {stats['elapsed']:.1f}s ({stats['fps']:.1f} fps)"
         ]
+        if stats['dropped']:
+            lines.append(f"Dropped {stats['dropped']} frames: input outpaced conversion")
         
         return "\n".join(lines)
     
+    def _execute_calibrate(self, args: Dict[str, Any]) -> str:
+        """
+        Execute the 'calibrate' command.
+        
+        Args:
+            args: Dictionary containing command arguments
+            
+        Returns:
+            A confirmation message or error message
+        """
+        font = args.get('font')
+        size = int(args.get('size', CharsetCalibrator.DEFAULT_FONT_SIZE))
+        char_set = self.ascii_converter.char_set
+        
+        try:
+            table = self.calibrator.get_table(char_set, font, size)
+        except (OSError, ValueError) as e:
+            return f"Failed to calibrate for font: {font}. Reason: {str(e)}"
+        
+        # Keep the current settings, only the brightness mapping changes
+        self.ascii_converter = AsciiConverter(char_set, self.ascii_converter.edge_threshold, char_table=table)
+        return f"Calibrated character set '{char_set}' for font: {font or 'default'} ({size}px)"
+    
+    def _execute_cancel(self, args: Dict[str, Any]) -> str:
+        """
+        Execute the 'cancel' command.
+        
+        Args:
+            args: Dictionary containing command arguments
+            
+        Returns:
+            A confirmation message
+        """
+        self.cancel()
+        return "Cancelling the running command."
+    
     def _execute_quit(self, args: Dict[str, Any]) -> str:
         """
         Execute the 'quit' command.
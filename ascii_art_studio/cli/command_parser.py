@@ -11,19 +11,29 @@ class CommandParser:
     
     # Command patterns
     LOAD_PATTERN = r'^load\s+(?P<filename>.+)$'
-    RENDER_PATTERN = r'^render$'
+    RENDER_PATTERN = r'^render(?:\s+(?P<mode>edges))?$'
     INFO_PATTERN = r'^info$'
+    STREAM_PATTERN = r'^stream\s+(?P<source>\S+)\s+(?P<width>\d+)x(?P<height>\d+)(?:\s+(?P<mode>gray|rgb))?$'
+    CANCEL_PATTERN = r'^cancel$'
     QUIT_PATTERN = r'^(quit|exit)$'
     HELP_PATTERN = r'^help(?:\s+(?P<command>\S+))?$'
+    CALIBRATE_PATTERN = r'^calibrate(?:\s+(?P<font>\S+)(?:\s+(?P<size>\d+))?)?$'
+
+    # Arguments that name keywords rather than files, normalized to lowercase
+    KEYWORD_ARGS = ('mode', 'command')
     
     def __init__(self):
         """Initialize the command parser with compiled regex patterns."""
+        # Command names are case-insensitive, arguments such as file names keep their case
         self.patterns = {
-            'load': re.compile(self.LOAD_PATTERN),
-            'render': re.compile(self.RENDER_PATTERN),
-            'info': re.compile(self.INFO_PATTERN),
-            'quit': re.compile(self.QUIT_PATTERN),
-            'help': re.compile(self.HELP_PATTERN),
+            'load': re.compile(self.LOAD_PATTERN, re.IGNORECASE),
+            'render': re.compile(self.RENDER_PATTERN, re.IGNORECASE),
+            'info': re.compile(self.INFO_PATTERN, re.IGNORECASE),
+            'stream': re.compile(self.STREAM_PATTERN, re.IGNORECASE),
+            'calibrate': re.compile(self.CALIBRATE_PATTERN, re.IGNORECASE),
+            'cancel': re.compile(self.CANCEL_PATTERN, re.IGNORECASE),
+            'quit': re.compile(self.QUIT_PATTERN, re.IGNORECASE),
+            'help': re.compile(self.HELP_PATTERN, re.IGNORECASE),
         }
     
     def parse_command(self, command_str: str) -> Tuple[str, Dict[str, Any]]:
@@ -37,8 +47,8 @@ class CommandParser:
             A tuple containing (command_type, arguments_dict)
             where command_type is 'unknown' if the command is not recognized
         """
-        # Strip whitespace and normalize
-        command_str = command_str.strip().lower()
+        # Strip surrounding whitespace
+        command_str = command_str.strip()
         
         if not command_str:
             return 'empty', {}
@@ -48,7 +58,8 @@ class CommandParser:
             match = pattern.match(command_str)
             if match:
                 # Extract named groups as arguments
-                args = {k: v for k, v in match.groupdict().items() if v is not None}
+                args = {k: v.lower() if k in self.KEYWORD_ARGS else v
+                        for k, v in match.groupdict().items() if v is not None}
                 return cmd_type, args
         
         # If no patterns match, it's an unknown command
@@ -66,8 +77,11 @@ class CommandParser:
         """
         help_texts = {
             'load': "load <filename> - Load an image file for conversion",
-            'render': "render - Convert the loaded image to ASCII art with fixed width (50px)",
+            'render': "render [edges] - Convert the loaded image to ASCII art with fixed width (50px), optionally with directional edges",
             'info': "info - Display information about the currently loaded image",
+            'stream': "stream <source> <width>x<height> [gray|rgb] - Render raw frames from a file or named pipe live",
+            'calibrate': "calibrate [font_file [size]] - Match characters to brightness by their ink coverage in a font",
+            'cancel': "cancel - Stop the running render or stream",
             'quit': "quit or exit - Exit the application",
             'help': "help [command] - Display help information"
         }
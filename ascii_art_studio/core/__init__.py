@@ -1,11 +1,16 @@
 """
 Core functionality for ASCII Art Studio.
 
-This package contains the core modules for image processing
-and ASCII conversion.
+This package contains the core modules for image processing,
+frame streaming, character set calibration, ASCII conversion and
+live rendering.
 """
 
 from .image_processor import ImageProcessor
-from .ascii_converter import AsciiConverter
+from .frame_stream import RawFrame, FrameStream
+from .charset_calibration import CharsetCalibrator
+from .ascii_converter import AsciiConverter, ConversionCancelled
+from .renderer import LiveRenderer
 
-__all__ = ['ImageProcessor', 'AsciiConverter']
+__all__ = ['ImageProcessor', 'RawFrame', 'FrameStream', 'CharsetCalibrator', 'AsciiConverter',
+           'ConversionCancelled', 'LiveRenderer']
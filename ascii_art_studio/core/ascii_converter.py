@@ -4,9 +4,22 @@ ASCII converter module for ASCII Art Studio.
 This module handles converting grayscale images to ASCII characters.
 """
 
-from typing import List, Optional
-# Import the ImageProcessor for type hints
-from ascii_art_studio.core.image_processor import ImageProcessor
+import math
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from PIL import Image, ImageChops, ImageDraw, ImageFilter
+from typing import Callable, List, Optional, Tuple, Union
+# Import the image sources for type hints
+from ascii_art_studio.core.image_processor import ImageProcessor, sample_grid
+from ascii_art_studio.core.frame_stream import RawFrame
+
+# Called with (rows done, total rows) while a conversion runs
+ProgressCallback = Callable[[int, int], None]
+
+
+class ConversionCancelled(Exception):
+    """Raised when a conversion is stopped through its cancel event."""
 
 
 class AsciiConverter:
@@ -15,17 +28,159 @@ class AsciiConverter:
     # Fixed character set from lightest to darkest
     DEFAULT_CHAR_SET = " .:-=+*#%@"
 
-    def __init__(self, char_set: Optional[str] = None) -> None:
+    # Directional characters for edges: vertical, rising, horizontal (two
+    # variants, by which side is brighter) and falling
+    EDGE_CHAR_SET = "|/-_\\"
+
+    # Minimum Sobel gradient magnitude for a cell to be drawn as an edge
+    DEFAULT_EDGE_THRESHOLD = 256
+
+    # Sobel kernels, positive where brightness grows rightwards/downwards.
+    # Pillow applies kernel rows bottom-up, hence the order of SOBEL_Y. The
+    # results are divided by 8 and offset by 128 so that signed gradients
+    # fit in an 8-bit image.
+    SOBEL_X = ImageFilter.Kernel((3, 3), [-1, 0, 1, -2, 0, 2, -1, 0, 1], scale=8, offset=128)
+    SOBEL_Y = ImageFilter.Kernel((3, 3), [1, 2, 1, 0, 0, 0, -1, -2, -1], scale=8, offset=128)
+
+    # Bands per worker in parallel conversions, for load balancing and progress
+    BANDS_PER_WORKER = 4
+
+    # Quantize a scaled gradient to 4 bits in the high or low half of a byte
+    _HIGH_NIBBLE_LUT = [value & 0xF0 for value in range(256)]
+    _LOW_NIBBLE_LUT = [value >> 4 for value in range(256)]
+
+    def __init__(self, char_set: Optional[str] = None,
+                 edge_threshold: int = DEFAULT_EDGE_THRESHOLD,
+                 char_table: Optional[str] = None) -> None:
         """
         Initialize the ASCII converter.
 
         Args:
             char_set (str, optional): Custom character set to use for conversion.
                                       Defaults to None (uses DEFAULT_CHAR_SET).
+            edge_threshold (int, optional): Minimum gradient magnitude drawn as an
+                                            edge in edge mode. Defaults to
+                                            DEFAULT_EDGE_THRESHOLD.
+            char_table (str, optional): 256 characters from char_set, the character
+                                        for each grayscale value, e.g. from
+                                        CharsetCalibrator.get_table(). Defaults to
+                                        None (linear mapping onto char_set).
+
+        Raises:
+            ValueError: If the character set is empty or the character table is invalid.
         """
         # Always use the specified fixed character set or default
         self.char_set = char_set if char_set is not None else self.DEFAULT_CHAR_SET
+        if not self.char_set:
+            raise ValueError("Character set must not be empty")
+
         self.char_range = len(self.char_set) - 1
+        self.edge_threshold = edge_threshold
+
+        if char_table is None:
+            # Proportional mapping, based on the number of characters in the set
+            char_table = "".join(self.char_set[value * self.char_range // 255] for value in range(256))
+        elif len(char_table) != 256 or not set(char_table) <= set(self.char_set):
+            raise ValueError("Character table must map all 256 values to characters of the set")
+
+        self.char_map = char_table
+        self._char_table = self._build_translation(self.char_map)
+
+        # Edge mode tables, built on first use by _build_edge_tables()
+        self._level_lut: List[int] = []
+        self._symbol_table: Union[bytes, str] = b""
+        self._edge_lut: List[int] = []
+        self._edge_mask_lut: List[int] = []
+
+    @staticmethod
+    def _build_translation(chars: str) -> Union[bytes, str]:
+        """
+        Build a translation table from a 256-character string.
+
+        Args:
+            chars (str): The character for every byte value 0-255.
+
+        Returns:
+            bytes: Table for bytes.translate() when the characters are pure ASCII.
+            str: Table for str.translate() otherwise.
+        """
+        try:
+            return chars.encode("ascii")
+        except UnicodeEncodeError:
+            return chars
+
+    @staticmethod
+    def _translate(buffer: bytes, table: Union[bytes, str]) -> str:
+        """
+        Map every byte of a buffer through a translation table.
+
+        Args:
+            buffer (bytes): The byte values to map.
+            table (bytes or str): A table built by _build_translation().
+
+        Returns:
+            str: One character per byte of the buffer.
+        """
+        if isinstance(table, bytes):
+            return buffer.translate(table).decode("ascii")
+        return buffer.decode("latin-1").translate(table)
+
+    def _build_edge_tables(self) -> None:
+        """
+        Build the tables for edge mode, once.
+
+        Edge mode works on symbol ids: 0..N-1 index the character set,
+        N and above index EDGE_CHAR_SET, so all of them must fit in a byte.
+
+        Raises:
+            ValueError: If the character set is too long for edge mode.
+        """
+        if self._level_lut:
+            return
+
+        if len(self.char_set) + len(self.EDGE_CHAR_SET) > 256:
+            raise ValueError("Edge mode supports character sets of at most 251 characters")
+
+        self._edge_lut, self._edge_mask_lut = self._build_edge_luts()
+        self._symbol_table = self._build_translation((self.char_set + self.EDGE_CHAR_SET).ljust(256))
+        self._level_lut = [self.char_set.index(char) for char in self.char_map]
+
+    def _build_edge_luts(self) -> Tuple[List[int], List[int]]:
+        """
+        Build the lookup tables that classify quantized gradients.
+
+        A gradient is quantized to an 8-bit index whose high nibble holds the
+        scaled horizontal gradient and whose low nibble holds the vertical
+        one, so orientation and strength are decided by one table lookup.
+
+        Returns:
+            tuple: (symbol lut, mask lut), each with 256 entries. The symbol lut
+                   gives the edge symbol id for an index, the mask lut is 255
+                   where the gradient is strong enough to be drawn as an edge.
+        """
+        symbol_lut = []
+        mask_lut = []
+        for index in range(256):
+            # Centre of the quantization bin, back in unscaled Sobel units
+            gx = ((index >> 4) * 16 + 8 - 128) * 8
+            gy = ((index & 0x0F) * 16 + 8 - 128) * 8
+
+            # The edge runs perpendicular to the gradient; y grows downwards
+            angle = math.degrees(math.atan2(gy, gx)) % 180
+            if angle < 22.5 or angle >= 157.5:
+                edge_char = "|"
+            elif angle < 67.5:
+                edge_char = "/"
+            elif angle < 112.5:
+                # Underscore when the brighter side is below the edge
+                edge_char = "_" if gy > 0 else "-"
+            else:
+                edge_char = "\\"
+
+            symbol_lut.append(len(self.char_set) + self.EDGE_CHAR_SET.index(edge_char))
+            mask_lut.append(255 if math.hypot(gx, gy) >= self.edge_threshold else 0)
+
+        return symbol_lut, mask_lut
 
     def pixel_to_ascii(self, pixel_value: int) -> str:
         """
@@ -39,18 +194,243 @@ class AsciiConverter:
         """
         # Map the pixel value (0-255) to a character in the set
         # 0 is black, 255 is white
-        # proportional mapping, based on the number of ascii characters in the set
-        index = int(pixel_value * self.char_range / 255)
-        return self.char_set[index]
+        return self.char_map[pixel_value]
+
+    def get_output_size(self, img_width: int, img_height: int, width: int) -> Tuple[int, int]:
+        """
+        Calculate the size of the ASCII art for an image.
+
+        Args:
+            img_width (int): Width of the source image in pixels.
+            img_height (int): Height of the source image in pixels.
+            width (int): The width of the ASCII art in characters.
+
+        Returns:
+            tuple: (width, height) of the ASCII art in characters.
+
+        Raises:
+            ValueError: If the width is not positive.
+        """
+        if width <= 0:
+            raise ValueError("Width must be positive")
+
+        # Calculate height to maintain aspect ratio
+        aspect_ratio = img_height / img_width
+        height = int(width * aspect_ratio / 2)  # Divide by 2 because characters are taller than wide
+        return width, max(height, 1)
+
+    def _edge_symbols(self, buffer: bytes, width: int,
+                      height: int) -> Tuple[bytes, Union[bytes, str]]:
+        """
+        Classify every cell of a downsampled grayscale buffer as edge or brightness.
+
+        Args:
+            buffer (bytes): Row-major grayscale values, one byte per character cell.
+            width (int): The width of each row in characters.
+            height (int): The number of rows.
+
+        Returns:
+            tuple: (one symbol id per cell, table mapping symbol ids to characters).
+
+        Raises:
+            ValueError: If the character set is too long for edge mode.
+        """
+        self._build_edge_tables()
 
-    def convert_image(self, image_processor: ImageProcessor, width: int = 50) -> Optional[List[str]]:
+        gray = Image.frombytes("L", (width, height), buffer)
+
+        # Quantize both gradients to 4 bits and pack them into one index byte
+        gx = gray.filter(self.SOBEL_X).point(self._HIGH_NIBBLE_LUT)
+        gy = gray.filter(self.SOBEL_Y).point(self._LOW_NIBBLE_LUT)
+        gradient_index = ImageChops.add(gx, gy)
+
+        # The filter leaves the outermost cells unprocessed, so never draw edges there
+        mask = gradient_index.point(self._edge_mask_lut)
+        ImageDraw.Draw(mask).rectangle([0, 0, width - 1, height - 1], outline=0)
+
+        symbols = Image.composite(gradient_index.point(self._edge_lut),
+                                  gray.point(self._level_lut), mask)
+        return symbols.tobytes(), self._symbol_table
+
+    def _map_rows(self, buffer: bytes, table: Union[bytes, str], width: int) -> List[str]:
+        """
+        Map a buffer to rows of ASCII art.
+
+        Args:
+            buffer (bytes): Row-major values, one byte per character cell.
+            table (bytes or str): A table built by _build_translation().
+            width (int): The width of each row in characters.
+
+        Returns:
+            list: List of strings representing rows of ASCII art.
+        """
+        # One table lookup per cell instead of a Python call per pixel
+        text = self._translate(buffer, table)
+        return [text[offset:offset + width] for offset in range(0, len(text), width)]
+
+    def edges_to_rows(self, buffer: bytes, width: int, height: int) -> List[str]:
+        """
+        Map a downsampled grayscale buffer to rows of ASCII art with directional edges.
+
+        Strong edges are drawn with EDGE_CHAR_SET according to their
+        orientation, every other cell uses the brightness character set.
+
+        Args:
+            buffer (bytes): Row-major grayscale values, one byte per character cell.
+            width (int): The width of each row in characters.
+            height (int): The number of rows.
+
+        Returns:
+            list: List of strings representing rows of ASCII art.
+        """
+        symbols, table = self._edge_symbols(buffer, width, height)
+        return self._map_rows(symbols, table, width)
+
+    def buffer_to_rows(self, buffer: bytes, width: int) -> List[str]:
+        """
+        Map a downsampled grayscale buffer to rows of ASCII art.
+
+        Args:
+            buffer (bytes): Row-major grayscale values, one byte per character cell.
+            width (int): The width of each row in characters.
+
+        Returns:
+            list: List of strings representing rows of ASCII art.
+        """
+        return self._map_rows(buffer, self._char_table, width)
+
+    def convert_band(self, image: Image.Image, width: int, height: int,
+                     top: int, bottom: int, edges: bool = False) -> List[str]:
+        """
+        Convert one horizontal band of the ASCII art.
+
+        Bands sample exactly the same pixels as a full conversion, so
+        converted bands can be stitched together in order.
+
+        Args:
+            image (Image.Image): The full-size grayscale image.
+            width (int): The width of the ASCII art in characters.
+            height (int): The height of the whole ASCII art in characters.
+            top (int): First row of the band.
+            bottom (int): Row after the last row of the band.
+            edges (bool, optional): Draw strong edges with directional characters.
+                                    Default is False.
+
+        Returns:
+            list: List of strings representing rows top to bottom - 1 of the ASCII art.
+        """
+        # Edge detection needs one row of context above and below the band
+        halo = 1 if edges else 0
+        start, stop = max(top - halo, 0), min(bottom + halo, height)
+        buffer = sample_grid(image, width, height, start, stop).tobytes()
+
+        if edges:
+            buffer, table = self._edge_symbols(buffer, width, stop - start)
+        else:
+            table = self._char_table
+
+        return self._map_rows(buffer[(top - start) * width:(bottom - start) * width], table, width)
+
+    def _convert_bands(self, image: Image.Image, width: int, height: int, edges: bool,
+                       workers: int, use_processes: bool,
+                       progress: Optional[ProgressCallback] = None,
+                       cancel: Optional[threading.Event] = None) -> List[str]:
+        """
+        Convert an image in horizontal bands on a pool of workers.
+
+        Threads share the image directly, as Pillow releases the GIL while
+        resampling and filtering. Processes read a single copy of the image
+        from shared memory.
+
+        Args:
+            image (Image.Image): The full-size grayscale image.
+            width (int): The width of the ASCII art in characters.
+            height (int): The height of the ASCII art in characters.
+            edges (bool): Draw strong edges with directional characters.
+            workers (int): Number of worker threads or processes.
+            use_processes (bool): Use processes instead of threads.
+            progress (ProgressCallback, optional): Called with (rows done, total rows).
+            cancel (threading.Event, optional): Stops the conversion when set.
+
+        Returns:
+            list: List of strings representing rows of ASCII art.
+
+        Raises:
+            ConversionCancelled: If the cancel event is set before all bands are done.
+        """
+        band_rows = max(1, math.ceil(height / (workers * self.BANDS_PER_WORKER)))
+        bands = [(top, min(top + band_rows, height)) for top in range(0, height, band_rows)]
+
+        shared: Optional[shared_memory.SharedMemory] = None
+        pool: Executor
+        if use_processes:
+            # Paste the image straight into shared memory, the only copy made. Images
+            # mapped onto a buffer are read-only, and paste() would copy them first
+            shared = shared_memory.SharedMemory(create=True, size=max(image.width * image.height, 1))
+            shared_image = Image.frombuffer("L", image.size, shared.buf, "raw", "L", 0, 1)
+            shared_image.readonly = 0
+            shared_image.paste(image)
+            # Release the image's export of the buffer so the block can be closed
+            del shared_image
+            pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+
+        try:
+            with pool:
+                futures: List[Future] = []
+                for top, bottom in bands:
+                    if shared is not None:
+                        futures.append(pool.submit(_convert_shared_band, self, shared.name, image.size,
+                                                   width, height, top, bottom, edges))
+                    else:
+                        futures.append(pool.submit(self.convert_band, image, width, height,
+                                                   top, bottom, edges))
+
+                # Stitch the bands in order as they complete
+                ascii_rows: List[str] = []
+                try:
+                    for future in futures:
+                        if cancel is not None and cancel.is_set():
+                            raise ConversionCancelled(
+                                f"Conversion cancelled after {len(ascii_rows)} of {height} rows")
+
+                        ascii_rows.extend(future.result())
+                        if progress is not None:
+                            progress(len(ascii_rows), height)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            if shared is not None:
+                shared.close()
+                shared.unlink()
+
+        return ascii_rows
+
+    def convert_image(self, image_processor: Union[ImageProcessor, RawFrame],
+                      width: int = 50, edges: bool = False,
+                      progress: Optional[ProgressCallback] = None,
+                      cancel: Optional[threading.Event] = None,
+                      workers: int = 1, use_processes: bool = False) -> Optional[List[str]]:
         """
         Convert an image to ASCII art.
 
         Args:
-            image_processor (ImageProcessor): An image processor with a loaded image.
+            image_processor (ImageProcessor or RawFrame): An image source with a loaded image.
             width (int, optional): The width of the ASCII art in characters.
                                    Default is 50.
+            edges (bool, optional): Draw strong edges with directional characters.
+                                    Default is False.
+            progress (ProgressCallback, optional): Called with (rows done, total rows)
+                                                   as rows are converted.
+            cancel (threading.Event, optional): Stops the conversion at the next
+                                                band of sampled rows when set.
+            workers (int, optional): Convert horizontal bands on this many workers
+                                     in parallel. Default is 1 (no parallelism).
+            use_processes (bool, optional): Use worker processes instead of threads.
+                                            Default is False.
 
         Returns:
             list: List of strings representing rows of ASCII art.
@@ -58,6 +438,7 @@ class AsciiConverter:
 
         Raises:
             ValueError: If the width is not positive.
+            ConversionCancelled: If the cancel event was set.
         """
         if not image_processor.is_image_loaded():
             return None
@@ -65,38 +446,33 @@ class AsciiConverter:
         dimensions = image_processor.get_image_dimensions()
         if dimensions is None:
             return None
-            
-        img_width, img_height = dimensions
-        
-        # Width is fixed at 50 or the value provided
-        if width <= 0:
-            raise ValueError("Width must be positive")
 
-        # Calculate height to maintain aspect ratio
-        aspect_ratio = img_height / img_width
-        height = int(width * aspect_ratio / 2)  # Divide by 2 because characters are taller than wide
-        
-        # Calculate how many image pixels to move for each ASCII character
-        x_step = img_width / width
-        y_step = img_height / height
-        
-        # Generate ASCII art
-        ascii_rows = []
-        for y in range(height):
-            row = ""
-            for x in range(width):
-                # Sample the image at calculated positions
-                img_x = int(x * x_step)
-                img_y = int(y * y_step)
-                pixel = image_processor.get_pixel(img_x, img_y)
-                if pixel is not None:
-                    row += self.pixel_to_ascii(pixel)
-                else:
-                    # Use a default character (space) if pixel is None
-                    row += " "
-            ascii_rows.append(row)
-            
-        return ascii_rows 
+        width, height = self.get_output_size(*dimensions, width)
+
+        if workers > 1:
+            image = image_processor.get_grayscale_image()
+            if image is None:
+                return None
+            return self._convert_bands(image, width, height, edges, workers, use_processes,
+                                       progress, cancel)
+
+        def checkpoint(done: int, total: int) -> None:
+            if cancel is not None and cancel.is_set():
+                raise ConversionCancelled(f"Conversion cancelled after {done} of {total} rows")
+            if progress is not None:
+                progress(done, total)
+
+        # Let the image source sample one pixel per character cell. Decoding
+        # and sampling are the real work, so progress and cancellation are
+        # checked between bands of sampled rows
+        buffer = image_processor.get_grayscale_buffer(
+            width, height, checkpoint if progress is not None or cancel is not None else None)
+        if buffer is None:
+            return None
+
+        if edges:
+            return self.edges_to_rows(buffer, width, height)
+        return self.buffer_to_rows(buffer, width)
 
     def render_to_string(self, ascii_rows: Optional[List[str]]) -> str:
         """
@@ -112,4 +488,34 @@ class AsciiConverter:
         if not ascii_rows:
             return ""
 
-        return "\n".join(ascii_rows) 
\ No newline at end of file
+        return "\n".join(ascii_rows) 
+
+
+def _convert_shared_band(converter: AsciiConverter, shared_name: str, image_size: Tuple[int, int],
+                         width: int, height: int, top: int, bottom: int, edges: bool) -> List[str]:
+    """
+    Convert one band of an image held in shared memory, in a worker process.
+
+    Args:
+        converter (AsciiConverter): The converter with the character tables to use.
+        shared_name (str): Name of the shared memory block holding the grayscale image.
+        image_size (tuple): (width, height) of the image in pixels.
+        width (int): The width of the ASCII art in characters.
+        height (int): The height of the whole ASCII art in characters.
+        top (int): First row of the band.
+        bottom (int): Row after the last row of the band.
+        edges (bool): Draw strong edges with directional characters.
+
+    Returns:
+        list: List of strings representing the rows of the band.
+    """
+    shared = shared_memory.SharedMemory(name=shared_name)
+    try:
+        image = Image.frombuffer("L", image_size, shared.buf, "raw", "L", 0, 1)
+        ascii_rows = converter.convert_band(image, width, height, top, bottom, edges)
+
+        # The image must release the shared buffer before it can be closed
+        del image
+        return ascii_rows
+    finally:
+        shared.close()
@@ -0,0 +1,163 @@
+"""
+Character set calibration module for ASCII Art Studio.
+
+This module handles measuring how much ink every glyph of a character set
+covers in a given font, and building brightness to character tables from
+those measurements.
+"""
+
+import bisect
+import json
+import os
+from PIL import Image, ImageDraw, ImageFont, ImageStat
+from typing import Dict, Optional, Union
+
+# Fonts as returned by ImageFont.truetype() or ImageFont.load_default()
+Font = Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]
+
+
+class CharsetCalibrator:
+    """
+    Class for building density-sorted brightness to character tables.
+
+    Glyph densities are rarely evenly spaced, so instead of mapping
+    brightness linearly onto the character set, every glyph is rasterized
+    and the table picks the glyph whose ink coverage best matches each of
+    the 256 grayscale values. Tables are cached in a JSON file keyed by
+    font and character set, so each combination is only calibrated once.
+    """
+
+    DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".ascii_art_studio", "charset_tables.json")
+    DEFAULT_FONT_SIZE = 16
+
+    def __init__(self, cache_path: Optional[str] = None) -> None:
+        """
+        Initialize the calibrator.
+
+        Args:
+            cache_path (str, optional): Path of the JSON table cache.
+                                        Defaults to DEFAULT_CACHE_PATH.
+        """
+        self.cache_path = cache_path if cache_path is not None else self.DEFAULT_CACHE_PATH
+        self._cache: Optional[Dict[str, str]] = None
+
+    def get_table(self, char_set: str, font_path: Optional[str] = None,
+                  font_size: int = DEFAULT_FONT_SIZE) -> str:
+        """
+        Get the brightness to character table for a character set and font.
+
+        The table is calibrated on the first request and read from the
+        cache afterwards.
+
+        Args:
+            char_set (str): Candidate characters.
+            font_path (str, optional): Path to a TrueType/OpenType font file.
+                                       Defaults to None (Pillow's default font,
+                                       scalable since Pillow 10.1).
+            font_size (int, optional): Font size in pixels. Default is DEFAULT_FONT_SIZE.
+
+        Returns:
+            str: 256 characters, the character for each grayscale value (0-255).
+
+        Raises:
+            ValueError: If the character set is empty.
+            OSError: If the font cannot be loaded.
+        """
+        if not char_set:
+            raise ValueError("Character set must not be empty")
+
+        font_id = os.path.abspath(font_path) if font_path else "default"
+        key = f"{font_id}:{font_size}:{char_set}"
+
+        cache = self._load_cache()
+        if key not in cache:
+            font = ImageFont.truetype(font_path, font_size) if font_path else ImageFont.load_default(font_size)
+            cache[key] = self.build_table(self.measure_coverage(char_set, font))
+            self._save_cache()
+
+        return cache[key]
+
+    @staticmethod
+    def measure_coverage(char_set: str, font: Font) -> Dict[str, float]:
+        """
+        Measure the ink coverage of every character in a font.
+
+        Args:
+            char_set (str): Characters to measure.
+            font (Font): The font to rasterize the characters with.
+
+        Returns:
+            dict: Fraction of the character cell covered by ink (0.0-1.0) per character.
+        """
+        # Every glyph is drawn in the same cell, as it would appear in a terminal
+        ascent, descent = font.getmetrics()
+        cell_width = max(1, max(int(round(font.getlength(char))) for char in char_set))
+        cell_size = (cell_width, max(1, ascent + descent))
+
+        coverage = {}
+        for char in char_set:
+            cell = Image.new("L", cell_size, 0)
+            ImageDraw.Draw(cell).text((0, 0), char, fill=255, font=font)
+            coverage[char] = ImageStat.Stat(cell).mean[0] / 255
+
+        return coverage
+
+    @staticmethod
+    def build_table(coverage: Dict[str, float]) -> str:
+        """
+        Build a brightness to character table from glyph coverages.
+
+        Coverages are stretched to the full 0-255 range, and each grayscale
+        value gets the character with the nearest coverage.
+
+        Args:
+            coverage (dict): Ink coverage per character, as from measure_coverage().
+
+        Returns:
+            str: 256 characters, the character for each grayscale value (0-255).
+        """
+        ordered = sorted(coverage, key=lambda char: coverage[char])
+        densities = [coverage[char] for char in ordered]
+        lowest, highest = densities[0], densities[-1]
+
+        # Glyphs that all look the same cannot express brightness
+        if highest == lowest:
+            return ordered[0] * 256
+
+        table = []
+        for value in range(256):
+            target = lowest + (highest - lowest) * value / 255
+            index = bisect.bisect_left(densities, target)
+
+            # Choose the closer of the two neighbouring densities
+            if index == len(densities) or (index > 0 and target - densities[index - 1] <= densities[index] - target):
+                index -= 1
+            table.append(ordered[index])
+
+        return "".join(table)
+
+    def _load_cache(self) -> Dict[str, str]:
+        """
+        Load the table cache from disk on first use.
+
+        Returns:
+            dict: Cached tables keyed by font, font size and character set.
+        """
+        if self._cache is None:
+            try:
+                with open(self.cache_path, encoding="utf-8") as cache_file:
+                    self._cache = json.load(cache_file)
+            except (OSError, ValueError):
+                # A missing or corrupt cache is rebuilt from scratch
+                self._cache = {}
+
+        return self._cache
+
+    def _save_cache(self) -> None:
+        """Write the table cache to disk."""
+        cache_dir = os.path.dirname(self.cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        with open(self.cache_path, "w", encoding="utf-8") as cache_file:
+            json.dump(self._cache, cache_file, ensure_ascii=False, indent=2)
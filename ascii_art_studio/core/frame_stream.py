@@ -0,0 +1,299 @@
+"""
+Frame stream module for ASCII Art Studio.
+
+This module handles reading raw video frames of a fixed size from a byte
+stream, such as stdin or a named pipe fed by ffmpeg.
+"""
+
+import threading
+from PIL import Image
+from typing import BinaryIO, Callable, Optional, Tuple
+
+from ascii_art_studio.core.image_processor import grid_rows, sample_grid
+
+
+class RawFrame:
+    """
+    A single raw frame wrapped around an existing buffer.
+
+    The frame exposes the same image source interface as ImageProcessor,
+    so it can be passed directly to AsciiConverter.convert_image().
+    Grayscale frames are used without copying. PIL cannot wrap RGB data
+    without copying it, so conversions copy only the rows they sample.
+    """
+
+    # Supported PIL modes and their bytes per pixel
+    BYTES_PER_PIXEL = {"L": 1, "RGB": 3}
+
+    def __init__(self, data: memoryview, width: int, height: int, mode: str = "L") -> None:
+        """
+        Initialize the frame.
+
+        Args:
+            data (memoryview): Row-major pixel data, width * height * bytes per pixel long.
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+            mode (str, optional): Pixel format, "L" (grayscale) or "RGB". Defaults to "L".
+
+        Raises:
+            ValueError: If the mode is unsupported or the data has the wrong size.
+        """
+        if mode not in self.BYTES_PER_PIXEL:
+            raise ValueError(f"Unsupported frame mode: {mode}")
+        if len(data) != width * height * self.BYTES_PER_PIXEL[mode]:
+            raise ValueError("Frame data does not match the frame size")
+
+        self.data = data
+        self.width = width
+        self.height = height
+        self.mode = mode
+
+    def is_image_loaded(self) -> bool:
+        """
+        Check if the frame holds an image.
+
+        Returns:
+            bool: Always True, a frame always wraps pixel data.
+        """
+        return True
+
+    def get_image_dimensions(self) -> Tuple[int, int]:
+        """
+        Get the dimensions of the frame.
+
+        Returns:
+            tuple: (width, height) in pixels.
+        """
+        return (self.width, self.height)
+
+    def get_pixel(self, x: int, y: int) -> Optional[int]:
+        """
+        Get the grayscale value of a pixel.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+
+        Returns:
+            int: Grayscale value (0-255) or None if the coordinates are out of bounds.
+        """
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
+            return None
+
+        if self.mode == "L":
+            return self.data[y * self.width + x]
+
+        # ITU-R 601-2 luma transform in the same rounded 16-bit fixed point
+        # that PIL uses for convert('L'), so pixels match get_grayscale_buffer()
+        offset = (y * self.width + x) * 3
+        r, g, b = self.data[offset:offset + 3]
+        return (r * 19595 + g * 38470 + b * 7471 + 0x8000) >> 16
+
+    def to_image(self) -> Image.Image:
+        """
+        Wrap the frame data in a PIL image.
+
+        Grayscale frames share memory with the underlying buffer, so the
+        image is only valid as long as the frame is. RGB frames are copied.
+
+        Returns:
+            Image.Image: The frame as a PIL image.
+        """
+        return Image.frombuffer(self.mode, (self.width, self.height), self.data, "raw", self.mode, 0, 1)
+
+    def get_grayscale_image(self) -> Image.Image:
+        """
+        Get the full-size frame as a grayscale image.
+
+        Returns:
+            Image.Image: The frame in mode 'L'.
+        """
+        image = self.to_image()
+        return image if image.mode == "L" else image.convert(mode="L")
+
+    def get_grayscale_buffer(self, width: int, height: int,
+                             checkpoint: Optional[Callable[[int, int], None]] = None) -> bytes:
+        """
+        Get the frame downsampled to the given size as raw grayscale bytes.
+
+        Args:
+            width (int): Target width in pixels.
+            height (int): Target height in pixels.
+            checkpoint (callable, optional): Called with (rows done, total rows)
+                                             while sampling, see sample_grid().
+
+        Returns:
+            bytes: Row-major grayscale values (0-255), one byte per pixel.
+        """
+        if self.mode == "L":
+            image = self.to_image()
+        else:
+            # Copy only the rows the grid samples instead of the whole frame;
+            # sampling the copy then picks each of its rows in turn
+            row_size = self.width * self.BYTES_PER_PIXEL[self.mode]
+            rows = b"".join(self.data[row * row_size:(row + 1) * row_size]
+                            for row in grid_rows(self.height, height))
+            image = Image.frombytes(self.mode, (self.width, height), rows)
+
+        # Downsample before converting so colour frames are only converted at output size
+        resized = sample_grid(image, width, height, checkpoint=checkpoint)
+        if resized.mode != "L":
+            resized = resized.convert(mode="L")
+        return resized.tobytes()
+
+
+class FrameStream:
+    """
+    Class for reading fixed-size raw frames from a byte stream.
+
+    A background thread reads frames straight into a small pool of
+    preallocated buffers (triple buffering). For live sources such as pipes,
+    when the reader finishes a frame before the previous one was consumed,
+    the older frame is dropped, so the consumer always gets the most recent
+    frame and the number of dropped frames tells whether input outpaces
+    conversion. Seekable sources such as regular files are not live, so
+    there the reader waits for the consumer instead and every frame is shown.
+    """
+
+    BUFFER_COUNT = 3
+
+    def __init__(self, source: BinaryIO, width: int, height: int, mode: str = "L",
+                 drop_frames: Optional[bool] = None) -> None:
+        """
+        Initialize the frame stream.
+
+        Args:
+            source (BinaryIO): Binary stream supporting readinto(), e.g. sys.stdin.buffer.
+            width (int): Frame width in pixels.
+            height (int): Frame height in pixels.
+            mode (str, optional): Pixel format, "L" (grayscale) or "RGB". Defaults to "L".
+            drop_frames (bool, optional): Drop frames the consumer has not taken yet
+                                          instead of waiting for it. Defaults to None
+                                          (drop only if the source is not seekable).
+
+        Raises:
+            ValueError: If the size is not positive or the mode is unsupported.
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("Frame size must be positive")
+        if mode not in RawFrame.BYTES_PER_PIXEL:
+            raise ValueError(f"Unsupported frame mode: {mode}")
+
+        self.source = source
+        self.width = width
+        self.height = height
+        self.mode = mode
+        self.frame_size = width * height * RawFrame.BYTES_PER_PIXEL[mode]
+
+        self.frames_read = 0
+        self.dropped_frames = 0
+
+        if drop_frames is None:
+            try:
+                drop_frames = not source.seekable()
+            except (AttributeError, OSError, ValueError):
+                drop_frames = True
+        self.drop_frames = drop_frames
+
+        self._buffers = [bytearray(self.frame_size) for _ in range(self.BUFFER_COUNT)]
+        self._ready: Optional[int] = None
+        self._in_use: Optional[int] = None
+        self._eof = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start reading frames in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._read_loop, daemon=True)
+            self._thread.start()
+
+    @property
+    def ended(self) -> bool:
+        """
+        Check if the stream has ended and every frame was consumed.
+
+        Returns:
+            bool: True if read_frame() will not return any more frames.
+        """
+        with self._condition:
+            return self._eof and self._ready is None
+
+    def read_frame(self, timeout: Optional[float] = None) -> Optional[RawFrame]:
+        """
+        Get the most recent complete frame.
+
+        The returned frame shares memory with the stream's buffers and is
+        only valid until the next call to read_frame().
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait for a frame.
+                                       Defaults to None (wait indefinitely).
+
+        Returns:
+            RawFrame: The most recent frame.
+            None: If the stream ended or the timeout expired.
+        """
+        self.start()
+        with self._condition:
+            # The previous frame is handed back to the reader
+            self._in_use = None
+            self._condition.wait_for(lambda: self._ready is not None or self._eof, timeout)
+            if self._ready is None:
+                return None
+
+            self._in_use, self._ready = self._ready, None
+            data = memoryview(self._buffers[self._in_use])
+
+            # A reader waiting for the consumer can publish its next frame now
+            self._condition.notify_all()
+
+        return RawFrame(data, self.width, self.height, self.mode)
+
+    def _read_loop(self) -> None:
+        """Read frames from the source until it ends."""
+        try:
+            while True:
+                with self._condition:
+                    # At most two buffers are taken (ready and in use), so one is always free
+                    index = next(i for i in range(self.BUFFER_COUNT) if i not in (self._ready, self._in_use))
+
+                if not self._fill_buffer(self._buffers[index]):
+                    break
+
+                with self._condition:
+                    # Without dropping, the reader is paced by the consumer
+                    if not self.drop_frames:
+                        self._condition.wait_for(lambda: self._ready is None)
+
+                    self.frames_read += 1
+                    if self._ready is not None:
+                        self.dropped_frames += 1
+                    self._ready = index
+                    self._condition.notify_all()
+        except (OSError, ValueError):
+            # The source failed or was closed while reading: treat it as the end of the stream
+            pass
+        finally:
+            with self._condition:
+                self._eof = True
+                self._condition.notify_all()
+
+    def _fill_buffer(self, buffer: bytearray) -> bool:
+        """
+        Read exactly one frame into a buffer.
+
+        Args:
+            buffer (bytearray): The buffer to fill.
+
+        Returns:
+            bool: True if a full frame was read, False if the stream ended first.
+        """
+        view = memoryview(buffer)
+        filled = 0
+        while filled < self.frame_size:
+            count = self.source.readinto(view[filled:])
+            if not count:
+                return False
+            filled += count
+        return True
@@ -4,23 +4,120 @@ Image processor module for ASCII Art Studio.
 This module handles loading and processing images for conversion to ASCII art.
 """
 
+import math
 import os
 from PIL import Image
-from typing import Dict, Tuple, Optional, Any
+from typing import Callable, Dict, List, Tuple, Optional, Any
+
+# Number of bands sampled separately when the caller wants checkpoints
+SAMPLE_STEPS = 8
+
+
+def grid_rows(source_height: int, height: int, top: int = 0,
+              bottom: Optional[int] = None) -> List[int]:
+    """
+    Get the source rows sampled by rows of a grid laid over an image.
+
+    Args:
+        source_height (int): Height of the image in pixels.
+        height (int): Number of grid rows.
+        top (int, optional): First grid row. Default is 0.
+        bottom (int, optional): Row after the last grid row.
+                                Defaults to None (all rows down to height).
+
+    Returns:
+        list: The source row at the centre of each grid row from top to bottom - 1.
+    """
+    if bottom is None:
+        bottom = height
+
+    return [(2 * y + 1) * source_height // (2 * height) for y in range(top, bottom)]
+
+
+def sample_grid(image: Image.Image, width: int, height: int,
+                top: int = 0, bottom: Optional[int] = None,
+                checkpoint: Optional[Callable[[int, int], None]] = None) -> Image.Image:
+    """
+    Sample one pixel per cell of a width x height grid laid over an image.
+
+    Source rows are chosen with exact integer arithmetic, so any band of
+    the grid samples the same pixels as the whole grid does.
+
+    Args:
+        image (Image.Image): The image to sample.
+        width (int): Number of grid columns.
+        height (int): Number of grid rows.
+        top (int, optional): First grid row to sample. Default is 0.
+        bottom (int, optional): Row after the last grid row to sample.
+                                Defaults to None (all rows down to height).
+        checkpoint (callable, optional): Called with (rows sampled, total rows)
+                                         between SAMPLE_STEPS bands of rows. It
+                                         may raise to stop the sampling.
+
+    Returns:
+        Image.Image: The sampled rows, in the mode of the source image.
+    """
+    if bottom is None:
+        bottom = height
+
+    if checkpoint is not None:
+        total = bottom - top
+        step = max(1, math.ceil(total / SAMPLE_STEPS))
+        bands = []
+        for start in range(top, bottom, step):
+            checkpoint(start - top, total)
+            bands.append(sample_grid(image, width, height, start, min(start + step, bottom)).tobytes())
+        checkpoint(total, total)
+        return Image.frombytes(image.mode, (width, total), b"".join(bands))
+
+    rows = grid_rows(image.height, height, top, bottom)
+    first, last = rows[0], rows[-1]
+
+    # Resample the columns of the rows in range once, then pick the rows themselves
+    strip = image.resize((width, last - first + 1), Image.NEAREST,
+                         box=(0, first, image.width, last + 1))
+    data = strip.tobytes()
+    row_size = len(data) // strip.height
+    picked = b"".join(data[(row - first) * row_size:(row - first + 1) * row_size] for row in rows)
+
+    return Image.frombytes(strip.mode, (width, bottom - top), picked)
 
 
 class ImageProcessor:
-    """Class for handling image loading and processing."""
+    """
+    Class for handling image loading and processing.
+
+    Loading only reads the image header. The pixels are decoded to
+    grayscale the first time they are needed, e.g. by the first render.
+    """
+
+    # EXIF tag holding the orientation the camera was held in
+    EXIF_ORIENTATION = 0x0112
+
+    # Transposition turning the stored pixels upright for each EXIF orientation
+    ORIENTATION_TRANSPOSE = {
+        2: Image.Transpose.FLIP_LEFT_RIGHT,
+        3: Image.Transpose.ROTATE_180,
+        4: Image.Transpose.FLIP_TOP_BOTTOM,
+        5: Image.Transpose.TRANSPOSE,
+        6: Image.Transpose.ROTATE_270,
+        7: Image.Transpose.TRANSVERSE,
+        8: Image.Transpose.ROTATE_90,
+    }
 
     def __init__(self):
         """Initialize the image processor."""
         self.current_image = None
+        self.source_image = None
         self.filename = None
+        self.header: Dict[str, Any] = {}
 
     def load_image(self, filename: str) -> Tuple[bool, Optional[str]]:
         """
         Load an image from a file.
 
+        Only the header is read; decoding is deferred until the pixels are needed.
+
         Args:
             filename (str): Path to the image file.
 
@@ -38,29 +135,110 @@ class ImageProcessor:
             if not os.path.exists(filename):
                 return False, f"File not found: {filename}"
 
-            # Try to load the image and convert to grayscale
+            # Open the image, which parses the header without decoding pixels
             image = Image.open(filename)
-            self.current_image = image.convert(mode='L')
+            header = {
+                "format": image.format,
+                "mode": image.mode,
+                "frames": getattr(image, "n_frames", 1),
+                "orientation": self._read_orientation(image),
+            }
+
+            self._close_source()
+            self.source_image = image
+            self.current_image = None
             self.filename = filename
+            self.header = header
             return True, None
 
         except Exception as e:
             return False, f"Error loading image: {str(e)}"
 
+    def _read_orientation(self, image: Image.Image) -> int:
+        """
+        Read the EXIF orientation of an opened image without decoding it.
+
+        For a PNG without EXIF data before its pixel data, getexif() decodes
+        the whole image to look for EXIF data after it. Only the EXIF data in
+        the header is used for PNG, so such trailing data is ignored.
+
+        Args:
+            image (Image.Image): The opened, not yet decoded image.
+
+        Returns:
+            int: The EXIF orientation (1-8), 1 if missing or invalid.
+        """
+        if image.format == "PNG":
+            exif = Image.Exif()
+            if "exif" in image.info:
+                exif.load(image.info["exif"])
+        else:
+            exif = image.getexif()
+
+        orientation = exif.get(self.EXIF_ORIENTATION, 1)
+        return orientation if orientation in self.ORIENTATION_TRANSPOSE else 1
+
+    def _close_source(self) -> None:
+        """Release the file of an image that was opened but not decoded."""
+        if self.source_image is not None and self.source_image is not self.current_image:
+            self.source_image.close()
+        self.source_image = None
+
+    def _decode(self) -> Optional[Image.Image]:
+        """
+        Decode the loaded image to grayscale, on first use.
+
+        The pixels are kept in their stored orientation. EXIF orientation is
+        applied to the small sampled grid instead of a full-size copy.
+
+        Returns:
+            Image.Image: The decoded image in mode 'L', or None if no image is loaded.
+        """
+        if self.current_image is None and self.source_image is not None:
+            image = self.source_image
+
+            # JPEG can decode straight to grayscale, so no full-size colour copy is made
+            image.draft("L", image.size)
+            gray = image if image.mode == "L" else image.convert(mode="L")
+            gray.load()
+
+            self.current_image = gray
+            self._close_source()
+
+        return self.current_image
+
+    def _orient(self, image: Image.Image) -> Image.Image:
+        """
+        Turn an image in stored orientation upright.
+
+        Args:
+            image (Image.Image): An image in the orientation of the stored pixels.
+
+        Returns:
+            Image.Image: The upright image, or the same image if it is upright already.
+        """
+        transpose = self.ORIENTATION_TRANSPOSE.get(self.header["orientation"])
+        return image if transpose is None else image.transpose(transpose)
+
     def get_image_info(self) -> Optional[Dict[str, Any]]:
         """
         Get information about the current image.
 
+        Answered from the image header, without decoding the pixels.
+
         Returns:
             dict: A dictionary containing image information or None if no image is loaded.
+                  Width and height are given upright, after EXIF orientation.
         """
-        if self.current_image is None:
+        dimensions = self.get_image_dimensions()
+        if dimensions is None:
             return None
 
         return {
             "filename": self.filename,
-            "width": self.current_image.width,
-            "height": self.current_image.height,
+            "width": dimensions[0],
+            "height": dimensions[1],
+            **self.header,
         }
 
     def get_pixel(self, x: int, y: int) -> Optional[int]:
@@ -76,26 +254,92 @@ class ImageProcessor:
                 0  = black
                 255 = white
         """
-        if self.current_image is None:
+        image = self._decode()
+        if image is None:
             return None
 
-        if x < 0 or x >= self.current_image.width or y < 0 or y >= self.current_image.height:
+        width, height = self.get_image_dimensions()
+        if x < 0 or x >= width or y < 0 or y >= height:
             return None
 
+        # Map the upright coordinates to the stored pixels
+        orientation = self.header["orientation"]
+        if orientation >= 5:
+            x, y = y, x
+        if orientation in (2, 3, 7, 8):
+            x = image.width - 1 - x
+        if orientation in (3, 4, 6, 7):
+            y = image.height - 1 - y
+
         pos = (x, y)
-        return self.current_image.getpixel(pos)
+        return image.getpixel(pos)
 
     def get_image_dimensions(self) -> Optional[Tuple[int, int]]:
         """
         Get the dimensions of the current image.
 
         Returns:
-            tuple: (width, height) or None if no image is loaded.
+            tuple: (width, height) upright, after EXIF orientation, or None if no image is loaded.
         """
-        if self.current_image is None:
+        image = self.current_image if self.current_image is not None else self.source_image
+        if image is None:
             return None
 
-        return (self.current_image.width, self.current_image.height)
+        # Orientations 5 to 8 turn the image by 90 degrees
+        width, height = image.size
+        if self.header["orientation"] >= 5:
+            return (height, width)
+        return (width, height)
+
+    def get_grayscale_image(self) -> Optional[Image.Image]:
+        """
+        Get the full-size, upright grayscale image.
+
+        Unlike get_grayscale_buffer(), this makes a full-size copy of images
+        with an EXIF orientation to turn them upright.
+
+        Returns:
+            Image.Image: The image in mode 'L', or None if no image is loaded.
+        """
+        image = self._decode()
+        if image is None:
+            return None
+
+        return self._orient(image)
+
+    def get_grayscale_buffer(self, width: int, height: int,
+                             checkpoint: Optional[Callable[[int, int], None]] = None) -> Optional[bytes]:
+        """
+        Get the image downsampled to the given size as raw grayscale bytes.
+
+        Args:
+            width (int): Target width in pixels.
+            height (int): Target height in pixels.
+            checkpoint (callable, optional): Called with (rows done, total rows)
+                                             while sampling, see sample_grid().
+
+        Returns:
+            bytes: Row-major grayscale values (0-255), one byte per pixel,
+                   or None if no image is loaded.
+        """
+        image = self._decode()
+        if image is None:
+            return None
+
+        # Sample the stored pixels and orient the small grid, not the full-size image
+        if self.header["orientation"] >= 5:
+            # The grid is turned by 90 degrees: its columns are sampled as rows
+            def stored_checkpoint(done: int, total: int) -> None:
+                # Report progress in rows of the upright grid
+                checkpoint(done * height // total, height)
+
+            grid = sample_grid(image, height, width,
+                               checkpoint=stored_checkpoint if checkpoint is not None else None)
+        else:
+            # Nearest-neighbour sampling picks one source pixel per output cell
+            grid = sample_grid(image, width, height, checkpoint=checkpoint)
+
+        return self._orient(grid).tobytes()
 
     def is_image_loaded(self) -> bool:
         """
@@ -104,4 +348,4 @@ class ImageProcessor:
         Returns:
             bool: True if an image is loaded, False otherwise.
         """
-        return self.current_image is not None 
\ No newline at end of file
+        return self.current_image is not None or self.source_image is not None 
\ No newline at end of file
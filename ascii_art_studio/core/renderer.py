@@ -0,0 +1,83 @@
+"""
+Renderer module for ASCII Art Studio.
+
+This module handles rendering a live stream of frames to the terminal.
+"""
+
+import sys
+import threading
+import time
+from typing import Dict, Any, Optional, TextIO
+
+from ascii_art_studio.core.ascii_converter import AsciiConverter
+from ascii_art_studio.core.frame_stream import FrameStream
+
+
+class LiveRenderer:
+    """Class for rendering a frame stream as ASCII art in place in the terminal."""
+
+    # Seconds to wait for a frame before checking for cancellation
+    POLL_INTERVAL = 0.1
+
+    # ANSI escape sequences
+    CLEAR_SCREEN = "\x1b[2J"
+    CURSOR_HOME = "\x1b[H"
+
+    def __init__(self, converter: AsciiConverter, width: int = 160,
+                 output: Optional[TextIO] = None) -> None:
+        """
+        Initialize the live renderer.
+
+        Args:
+            converter (AsciiConverter): The converter used for every frame.
+            width (int, optional): The width of the ASCII art in characters. Default is 160.
+            output (TextIO, optional): Where to write frames. Defaults to sys.stdout.
+        """
+        self.converter = converter
+        self.width = width
+        self.output = output if output is not None else sys.stdout
+
+    def run(self, stream: FrameStream, cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        Render frames until the stream ends or rendering is cancelled.
+
+        Args:
+            stream (FrameStream): The stream to read frames from.
+            cancel (threading.Event, optional): Stops rendering when set.
+
+        Returns:
+            dict: Statistics with the number of rendered and dropped frames,
+                  elapsed seconds and average frames per second.
+        """
+        rendered = 0
+        start = time.perf_counter()
+        self.output.write(self.CLEAR_SCREEN)
+
+        while cancel is None or not cancel.is_set():
+            frame = stream.read_frame(timeout=self.POLL_INTERVAL)
+            if frame is None:
+                if stream.ended:
+                    break
+                continue
+
+            ascii_rows = self.converter.convert_image(frame, width=self.width)
+            rendered += 1
+            elapsed = time.perf_counter() - start
+            fps = rendered / elapsed if elapsed > 0 else 0.0
+
+            status = f"{fps:5.1f} fps | dropped {stream.dropped_frames}"
+            if stream.dropped_frames:
+                status += " | input outpaces conversion"
+
+            # Redraw in place: a single write per frame avoids flicker
+            self.output.write(self.CURSOR_HOME + self.converter.render_to_string(ascii_rows)
+                              + "\n" + status + "\x1b[K\n")
+            self.output.flush()
+
+        elapsed = time.perf_counter() - start
+        return {
+            "rendered": rendered,
+            "dropped": stream.dropped_frames,
+            "elapsed": elapsed,
+            "fps": rendered / elapsed if elapsed > 0 else 0.0,
+        }
@@ -0,0 +1,68 @@
+"""
+Benchmark for parallel band rendering in ASCII Art Studio.
+
+Renders one image as a very wide poster with 1, 2, 4 and 8 workers, using
+both worker threads and worker processes, and prints the speedup over a
+single worker.
+
+Usage (from the repository root, with the package installed):
+    python benchmarks/parallel_render.py [image_file] [width]
+"""
+
+import os
+import sys
+import time
+
+from ascii_art_studio.core import AsciiConverter, ImageProcessor
+
+DEFAULT_IMAGE = os.path.join("tests", "test_images", "girl.jpg")
+DEFAULT_WIDTH = 2000
+WORKER_COUNTS = (1, 2, 4, 8)
+REPEATS = 5
+
+
+def time_render(converter, image_processor, width, edges, workers, use_processes):
+    """
+    Time a render, keeping the best of several runs.
+
+    Returns:
+        float: Seconds taken by the fastest run.
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        converter.convert_image(image_processor, width=width, edges=edges,
+                                workers=workers, use_processes=use_processes)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark and print a table of timings and speedups."""
+    filename = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_IMAGE
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_WIDTH
+
+    image_processor = ImageProcessor()
+    success, error_message = image_processor.load_image(filename)
+    if not success:
+        print(error_message)
+        return 1
+
+    converter = AsciiConverter()
+    print(f"{filename}, width {width}, {os.cpu_count()} CPUs, best of {REPEATS}")
+    print(f"{'mode':<8}{'pool':<10}{'workers':>8}{'ms':>10}{'speedup':>10}")
+
+    for edges in (False, True):
+        for use_processes in (False, True):
+            baseline = None
+            for workers in WORKER_COUNTS:
+                seconds = time_render(converter, image_processor, width, edges, workers, use_processes)
+                baseline = baseline or seconds
+                print(f"{'edges' if edges else 'plain':<8}{'process' if use_processes else 'thread':<10}"
+                      f"{workers:>8}{seconds * 1000:>10.1f}{baseline / seconds:>9.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
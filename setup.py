@@ -20,21 +20,19 @@ setup(
     author="ASCII Art Studio Team",
     packages=find_packages(),
     install_requires=[
-        "Pillow",
+        "Pillow>=10.1",
     ],
     entry_points={
         "console_scripts": [
             "ascii-art-studio=ascii_art_studio.__main__:main",
         ],
     },
-    python_requires=">=3.6",
+    python_requires=">=3.8",
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: End Users/Desktop",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Topic :: Multimedia :: Graphics",
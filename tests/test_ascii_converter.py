@@ -6,7 +6,9 @@ This script tests the functionality of the AsciiConverter class.
 
 import unittest
 import os
-from ascii_art_studio.core.ascii_converter import AsciiConverter
+import threading
+from PIL import Image
+from ascii_art_studio.core.ascii_converter import AsciiConverter, ConversionCancelled
 from ascii_art_studio.core.image_processor import ImageProcessor
 
 
@@ -52,6 +54,75 @@ class TestAsciiConverter(unittest.TestCase):
             self.assertEqual(len(ascii_art[0]), 40)
             self.assertEqual(type(ascii_art[0]), str)
 
+    def test_edge_mode_glyphs(self):
+        """Test that strong edges are drawn with directional characters."""
+        # Vertical edge: dark left half, bright right half
+        vertical = bytes(([0] * 4 + [255] * 4) * 8)
+        rows = self.converter.edges_to_rows(vertical, 8, 8)
+        self.assertEqual(rows[4], "   ||@@@")
+        
+        # Rising diagonal: bright below the anti-diagonal
+        image = Image.new('L', (8, 8), 0)
+        for y in range(8):
+            for x in range(8 - y, 8):
+                image.putpixel((x, y), 255)
+        rows = self.converter.edges_to_rows(image.tobytes(), 8, 8)
+        self.assertIn("///", rows[4])
+        self.assertNotIn("\\", "".join(rows))
+        
+        # Flat areas keep the brightness characters
+        flat = bytes([255] * 64)
+        self.assertEqual(self.converter.edges_to_rows(flat, 8, 8), ["@" * 8] * 8)
+
+    def test_long_character_set(self):
+        """Test that long character sets only fail when edges are requested."""
+        converter = AsciiConverter("".join(chr(code) for code in range(32, 332)))
+        self.assertEqual(len(converter.convert_image(self.image_proc, width=40)[0]), 40)
+        
+        with self.assertRaises(ValueError):
+            converter.convert_image(self.image_proc, width=40, edges=True)
+
+    def test_edge_mode_conversion(self):
+        """Test converting an image in edge mode."""
+        ascii_art = self.converter.convert_image(self.image_proc, width=40, edges=True)
+        
+        self.assertEqual(type(ascii_art), list)
+        self.assertEqual(len(ascii_art[0]), 40)
+
+    def test_conversion_progress(self):
+        """Test that progress is reported while sampling, up to the last row."""
+        reports = []
+        ascii_art = self.converter.convert_image(
+            self.image_proc, width=50, progress=lambda done, total: reports.append((done, total)))
+        
+        # A default render is reported in several steps, not only when done
+        self.assertGreater(len(reports), 2)
+        self.assertEqual(reports, sorted(reports))
+        self.assertEqual(reports[-1], (len(ascii_art), len(ascii_art)))
+
+    def test_conversion_cancel(self):
+        """Test that a set cancel event stops the conversion."""
+        cancel = threading.Event()
+        
+        # Cancel as soon as the first rows are done
+        def progress(done, total):
+            cancel.set()
+        
+        with self.assertRaises(ConversionCancelled):
+            self.converter.convert_image(self.image_proc, width=40, progress=progress, cancel=cancel)
+
+    def test_parallel_conversion_matches_serial(self):
+        """Test that band-parallel conversion gives the same rows as a serial one."""
+        for edges in (False, True):
+            serial = self.converter.convert_image(self.image_proc, width=120, edges=edges)
+            
+            threaded = self.converter.convert_image(self.image_proc, width=120, edges=edges, workers=3)
+            self.assertEqual(threaded, serial)
+            
+            processes = self.converter.convert_image(self.image_proc, width=120, edges=edges,
+                                                     workers=2, use_processes=True)
+            self.assertEqual(processes, serial)
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
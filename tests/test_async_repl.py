@@ -0,0 +1,149 @@
+"""
+Test file for the asynchronous REPL module of ASCII Art Studio.
+
+This script tests the functionality of the AsyncRepl class with a stub
+command executor.
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from ascii_art_studio.cli.async_repl import AsyncRepl
+from ascii_art_studio.cli.command_parser import CommandParser
+
+
+class StubExecutor:
+    """A command executor that records commands instead of running them."""
+
+    def __init__(self, blocking=False):
+        self.parser = CommandParser()
+        self.is_running = True
+        self.cancel_event = threading.Event()
+        self.progress = None
+        self.executed = []
+        self.blocking = blocking
+
+    def reset_status(self):
+        self.cancel_event.clear()
+        self.progress = None
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def execute_command(self, command):
+        self.executed.append(command)
+        # A blocking command runs until it is cancelled
+        if self.blocking and not self.cancel_event.wait(timeout=5):
+            return "Timed out."
+        return f"Done: {command}"
+
+
+class TestAsyncRepl(unittest.TestCase):
+    """Test cases for the AsyncRepl class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.output = io.StringIO()
+
+    def run_repl(self, repl, lines):
+        """Run the REPL loop on the given input lines instead of the terminal."""
+        def read_input():
+            for line in lines:
+                repl._loop.call_soon_threadsafe(repl._on_input, line)
+
+        repl._read_input = read_input
+        with contextlib.redirect_stdout(self.output):
+            repl.run()
+
+    def test_queued_commands_run_in_order(self):
+        """Test that commands entered while one runs are queued and run in order."""
+        executor = StubExecutor()
+        self.run_repl(AsyncRepl(executor), ["render", "info", "help", None])
+
+        self.assertEqual(executor.executed, ["render", "info", "help"])
+        self.assertIn("Queued: info", self.output.getvalue())
+        self.assertIn("Done: help", self.output.getvalue())
+
+    def test_eof_ends_loop(self):
+        """Test that the end of input stops the REPL."""
+        executor = StubExecutor()
+        self.run_repl(AsyncRepl(executor), ["info", None])
+
+        # The loop returns without a 'quit' command
+        self.assertTrue(executor.is_running)
+        self.assertEqual(executor.executed, ["info"])
+
+    def test_cancel_while_busy(self):
+        """Test that 'cancel' stops the running command right away."""
+        executor = StubExecutor(blocking=True)
+        repl = AsyncRepl(executor)
+
+        async def scenario():
+            repl._loop = asyncio.get_running_loop()
+            repl._commands = asyncio.Queue()
+            with ThreadPoolExecutor(max_workers=1) as worker:
+                task = asyncio.ensure_future(repl._run_command(worker, "render"))
+                await asyncio.sleep(0.05)
+                self.assertTrue(repl.is_busy)
+
+                repl._on_input("cancel")
+                self.assertTrue(executor.cancel_event.is_set())
+                await task
+
+        with contextlib.redirect_stdout(self.output):
+            asyncio.run(scenario())
+
+        self.assertFalse(repl.is_busy)
+        self.assertIn("Cancelling the running command.", self.output.getvalue())
+        self.assertIn("Done: render", self.output.getvalue())
+
+    def test_cancel_right_after_command(self):
+        """Test that 'cancel' entered right after a command is never lost."""
+        for _ in range(10):
+            executor = StubExecutor(blocking=True)
+            self.run_repl(AsyncRepl(executor), ["render", "cancel", None])
+
+            self.assertEqual(executor.executed, ["render"])
+            self.assertNotIn("Timed out.", self.output.getvalue())
+            self.assertIn("Done: render", self.output.getvalue())
+
+    def test_cancel_when_idle(self):
+        """Test that 'cancel' without a running command is not queued."""
+        executor = StubExecutor()
+        self.run_repl(AsyncRepl(executor), ["cancel", None])
+
+        self.assertEqual(executor.executed, [])
+        self.assertFalse(executor.cancel_event.is_set())
+        self.assertIn("Nothing to cancel.", self.output.getvalue())
+
+
+    def test_quit_with_open_stdin(self):
+        """Test that 'quit' exits cleanly while piped input is still open."""
+        process = subprocess.Popen(
+            [sys.executable, "-m", "ascii_art_studio"],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            process.stdin.write(b"quit\n")
+            process.stdin.flush()
+            returncode = process.wait(timeout=10)
+            output, errors = process.stdout.read(), process.stderr.read()
+        finally:
+            process.stdin.close()
+            process.stdout.close()
+            process.stderr.close()
+            if process.poll() is None:
+                process.kill()
+
+        self.assertEqual(returncode, 0, errors.decode())
+        self.assertIn(b"Goodbye!", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Test file for the character set calibration module of ASCII Art Studio.
+
+This script tests the functionality of the CharsetCalibrator class.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from ascii_art_studio.core.ascii_converter import AsciiConverter
+from ascii_art_studio.core.charset_calibration import CharsetCalibrator
+
+
+class TestCharsetCalibrator(unittest.TestCase):
+    """Test cases for the CharsetCalibrator class."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.temp_dir.name, "tables.json")
+        self.calibrator = CharsetCalibrator(self.cache_path)
+
+    def tearDown(self):
+        """Clean up the temporary cache."""
+        self.temp_dir.cleanup()
+
+    def test_build_table_is_non_uniform(self):
+        """Test that brightness follows coverage rather than character order."""
+        table = CharsetCalibrator.build_table({' ': 0.0, '#': 0.2, '.': 0.1, '@': 1.0})
+
+        self.assertEqual(len(table), 256)
+        self.assertEqual(table[0], ' ')
+        self.assertEqual(table[255], '@')
+        # '@' is far denser than the rest, so it covers the whole bright range
+        self.assertEqual(table[160:], '@' * 96)
+        self.assertLess(table.count('.'), table.count('@'))
+
+    def test_calibrated_table_is_cached(self):
+        """Test that a calibrated table is stored and reused."""
+        table = self.calibrator.get_table(AsciiConverter.DEFAULT_CHAR_SET)
+        self.assertEqual(len(table), 256)
+        self.assertEqual(table[0], ' ')
+
+        with open(self.cache_path, encoding="utf-8") as cache_file:
+            self.assertIn(table, json.load(cache_file).values())
+
+        # A new calibrator reads the table from the cache
+        self.assertEqual(CharsetCalibrator(self.cache_path).get_table(AsciiConverter.DEFAULT_CHAR_SET), table)
+
+    def test_default_font_uses_size(self):
+        """Test that the default font is calibrated at the requested size."""
+        self.calibrator.get_table(AsciiConverter.DEFAULT_CHAR_SET, font_size=8)
+        self.calibrator.get_table(AsciiConverter.DEFAULT_CHAR_SET, font_size=32)
+
+        with open(self.cache_path, encoding="utf-8") as cache_file:
+            self.assertEqual(len(json.load(cache_file)), 2)
+
+    def test_converter_uses_table(self):
+        """Test converting pixels through a calibrated table."""
+        table = self.calibrator.get_table(AsciiConverter.DEFAULT_CHAR_SET)
+        converter = AsciiConverter(char_table=table)
+
+        for value in (0, 100, 200, 255):
+            self.assertEqual(converter.pixel_to_ascii(value), table[value])
+
+    def test_invalid_table(self):
+        """Test that tables with foreign characters are rejected."""
+        with self.assertRaises(ValueError):
+            AsciiConverter(char_table="X" * 256)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,11 @@ class TestCommandParser(unittest.TestCase):
         self.assertEqual(cmd_type, "load")
         self.assertEqual(args, {'filename': 'path/to/test.jpg'})
         
+        # Filenames keep their case, command names do not matter
+        cmd_type, args = self.parser.parse_command("LOAD Photos/Test.JPG")
+        self.assertEqual(cmd_type, "load")
+        self.assertEqual(args, {'filename': 'Photos/Test.JPG'})
+        
         # Invalid load command (no filename)
         cmd_type, args = self.parser.parse_command("load")
         self.assertEqual(cmd_type, "unknown")
@@ -44,6 +49,43 @@ class TestCommandParser(unittest.TestCase):
         self.assertEqual(cmd_type, "help")
         self.assertEqual(args, {'command': 'load'})
 
+    def test_parse_render_command(self):
+        """Test parsing render commands."""
+        cmd_type, args = self.parser.parse_command("render")
+        self.assertEqual(cmd_type, "render")
+        self.assertEqual(args, {})
+        
+        # Edge mode
+        cmd_type, args = self.parser.parse_command("render edges")
+        self.assertEqual(cmd_type, "render")
+        self.assertEqual(args, {'mode': 'edges'})
+
+    def test_parse_stream_command(self):
+        """Test parsing stream commands."""
+        # Default grayscale frames
+        cmd_type, args = self.parser.parse_command("stream /tmp/frames 320x240")
+        self.assertEqual(cmd_type, "stream")
+        self.assertEqual(args, {'source': '/tmp/frames', 'width': '320', 'height': '240'})
+        
+        # Explicit colour frames
+        cmd_type, args = self.parser.parse_command("stream /tmp/frames 320x240 rgb")
+        self.assertEqual(cmd_type, "stream")
+        self.assertEqual(args['mode'], 'rgb')
+        
+        # Missing frame size
+        cmd_type, args = self.parser.parse_command("stream /tmp/frames")
+        self.assertEqual(cmd_type, "unknown")
+
+    def test_parse_calibrate_command(self):
+        """Test parsing calibrate commands."""
+        cmd_type, args = self.parser.parse_command("calibrate")
+        self.assertEqual(cmd_type, "calibrate")
+        self.assertEqual(args, {})
+        
+        cmd_type, args = self.parser.parse_command("calibrate fonts/Mono.ttf 12")
+        self.assertEqual(cmd_type, "calibrate")
+        self.assertEqual(args, {'font': 'fonts/Mono.ttf', 'size': '12'})
+
     def test_unknown_commands(self):
         """Test parsing unknown commands."""
         cmd_type, args = self.parser.parse_command("unknown")
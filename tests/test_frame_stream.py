@@ -0,0 +1,173 @@
+"""
+Test file for the frame stream module of ASCII Art Studio.
+
+This script tests the functionality of the RawFrame, FrameStream and
+LiveRenderer classes.
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+from ascii_art_studio.cli.command_executor import CommandExecutor
+from ascii_art_studio.core.ascii_converter import AsciiConverter
+from ascii_art_studio.core.frame_stream import RawFrame, FrameStream
+from ascii_art_studio.core.image_processor import sample_grid
+from ascii_art_studio.core.renderer import LiveRenderer
+
+
+class PipeSource(io.RawIOBase):
+    """An in-memory source that is not seekable, like a pipe."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._data.readinto(buffer)
+
+
+class SlowConverter(AsciiConverter):
+    """A converter that takes a fixed time per frame."""
+
+    def convert_image(self, image_processor, *args, **kwargs):
+        time.sleep(0.01)
+        return super().convert_image(image_processor, *args, **kwargs)
+
+
+class TestRawFrame(unittest.TestCase):
+    """Test cases for the RawFrame class."""
+
+    def test_frame_wraps_buffer_without_copying(self):
+        """Test that changes to the buffer are visible through the frame."""
+        buffer = bytearray(4 * 2)
+        frame = RawFrame(memoryview(buffer), 4, 2)
+
+        buffer[5] = 200
+        self.assertEqual(frame.get_pixel(1, 1), 200)
+        self.assertIsNone(frame.get_pixel(4, 0))
+
+    def test_rgb_pixel_is_grayscale(self):
+        """Test that RGB frames report grayscale pixel values."""
+        frame = RawFrame(memoryview(bytes([255, 255, 255, 0, 0, 0])), 2, 1, mode="RGB")
+        self.assertEqual(frame.get_pixel(0, 0), 255)
+        self.assertEqual(frame.get_pixel(1, 0), 0)
+
+    def test_rgb_pixel_matches_grayscale_buffer(self):
+        """Test that RGB pixels are converted to grayscale exactly like PIL does."""
+        # Values where a truncating transform is off by one
+        data = bytes([0, 1, 0, 3, 7, 250] + list(range(0, 252, 7)) + list(range(255, 3, -7)))
+        frame = RawFrame(memoryview(data), len(data) // 3, 1, mode="RGB")
+        
+        buffer = frame.get_grayscale_buffer(frame.width, 1)
+        self.assertEqual([frame.get_pixel(x, 0) for x in range(frame.width)], list(buffer))
+        self.assertEqual(frame.get_pixel(0, 0), 1)
+
+    def test_rgb_frame_sampled_like_image(self):
+        """Test that RGB frames sample the same pixels as their full-size image."""
+        data = bytes(value % 256 for value in range(37 * 23 * 3))
+        frame = RawFrame(memoryview(data), 37, 23, mode="RGB")
+        
+        for width, height in ((37, 23), (10, 7), (5, 20)):
+            expected = sample_grid(frame.to_image(), width, height).convert("L").tobytes()
+            self.assertEqual(frame.get_grayscale_buffer(width, height), expected)
+
+    def test_invalid_frame_size(self):
+        """Test that data of the wrong length is rejected."""
+        with self.assertRaises(ValueError):
+            RawFrame(memoryview(bytes(5)), 2, 2)
+
+    def test_converter_accepts_frame(self):
+        """Test converting a frame to ASCII art."""
+        # Left half black, right half white
+        frame = RawFrame(memoryview(bytes([0, 0, 255, 255] * 4)), 4, 4)
+        ascii_art = AsciiConverter().convert_image(frame, width=4)
+
+        self.assertEqual(ascii_art, ["  @@", "  @@"])
+
+
+class TestFrameStream(unittest.TestCase):
+    """Test cases for the FrameStream class."""
+
+    def test_read_frames_until_end(self):
+        """Test reading consecutive frames from a stream."""
+        # Two complete frames followed by a partial one
+        source = io.BytesIO(bytes([10] * 6 + [20] * 6 + [30] * 3))
+        stream = FrameStream(source, 3, 2)
+
+        values = []
+        while True:
+            frame = stream.read_frame(timeout=5)
+            if frame is None:
+                break
+            values.append(frame.get_pixel(0, 0))
+
+        # A seekable source is paced by the consumer, so no frame is dropped
+        self.assertEqual(values, [10, 20])
+        self.assertEqual(stream.frames_read, 2)
+        self.assertEqual(stream.dropped_frames, 0)
+
+    def test_live_source_drops_frames(self):
+        """Test that a live source drops frames the consumer cannot keep up with."""
+        stream = FrameStream(PipeSource(bytes(4 * 4 * 50)), 4, 4)
+        self.assertTrue(stream.drop_frames)
+
+        stats = LiveRenderer(SlowConverter(), width=4, output=io.StringIO()).run(stream)
+
+        self.assertGreater(stats["dropped"], 0)
+        self.assertEqual(stats["rendered"] + stats["dropped"], 50)
+
+    def test_invalid_mode(self):
+        """Test that unsupported frame modes are rejected."""
+        with self.assertRaises(ValueError):
+            FrameStream(io.BytesIO(), 2, 2, mode="CMYK")
+
+
+class TestLiveRenderer(unittest.TestCase):
+    """Test cases for the LiveRenderer class and the stream command."""
+
+    def test_file_source_renders_every_frame(self):
+        """Test that a regular file plays all of its frames."""
+        output = io.StringIO()
+        stream = FrameStream(io.BytesIO(bytes(4 * 4 * 300)), 4, 4)
+        stats = LiveRenderer(AsciiConverter(), width=4, output=output).run(stream)
+
+        self.assertEqual(stats["rendered"], 300)
+        self.assertEqual(stats["dropped"], 0)
+        self.assertIn("dropped 0", output.getvalue())
+        self.assertNotIn("input outpaces conversion", output.getvalue())
+
+    def test_dropped_frames_status_and_summary(self):
+        """Test that dropped frames are reported while streaming and in the summary."""
+        executor = CommandExecutor()
+        executor.ascii_converter = SlowConverter()
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            summary = executor.stream(PipeSource(bytes(4 * 4 * 50)), 4, 4)
+
+        self.assertIn("input outpaces conversion", output.getvalue())
+        self.assertIn("Rendered", summary)
+        self.assertIn("frames: input outpaced conversion", summary)
+
+    def test_stream_command_reads_file(self):
+        """Test streaming frames from a file with the stream command."""
+        executor = CommandExecutor()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "frames.raw")
+            with open(filename, "wb") as frames_file:
+                frames_file.write(bytes(8 * 6 * 3 * 5))
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                summary = executor.execute_command(f"stream {filename} 8x6 rgb")
+
+        self.assertTrue(summary.startswith("Rendered 5 frames"))
+        self.assertNotIn("Dropped", summary)
+
+
+if __name__ == '__main__':
+    unittest.main()
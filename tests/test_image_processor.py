@@ -6,6 +6,8 @@ This script tests the essential functionality of the ImageProcessor class.
 
 import unittest
 import os
+import tempfile
+from PIL import Image
 from ascii_art_studio.core.image_processor import ImageProcessor
 
 
@@ -43,6 +45,85 @@ class TestImageProcessor(unittest.TestCase):
         self.assertEqual(width, info["width"])
         self.assertEqual(height, info["height"])
 
+    def test_lazy_loading(self):
+        """Test that loading reads the header and defers decoding."""
+        self.processor.load_image(self.test_image)
+        self.assertIsNone(self.processor.current_image)
+        
+        info = self.processor.get_image_info()
+        self.assertEqual(info["format"], "JPEG")
+        self.assertEqual(info["frames"], 1)
+        self.assertEqual(info["orientation"], 1)
+        self.assertIsNone(self.processor.current_image)
+        
+        # The first pixel access decodes the image to grayscale
+        self.processor.get_pixel(0, 0)
+        self.assertEqual(self.processor.current_image.mode, "L")
+        self.assertEqual(self.processor.get_image_dimensions(), (info["width"], info["height"]))
+
+    def test_lazy_loading_png(self):
+        """Test that PNG images are not decoded to read their EXIF orientation."""
+        exif = Image.Exif()
+        exif[ImageProcessor.EXIF_ORIENTATION] = 6
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for orientation, options in ((1, {}), (6, {"exif": exif})):
+                filename = os.path.join(temp_dir, f"image{orientation}.png")
+                Image.new("RGB", (40, 20)).save(filename, **options)
+                self.processor.load_image(filename)
+                
+                info = self.processor.get_image_info()
+                self.assertEqual(info["format"], "PNG")
+                self.assertEqual(info["orientation"], orientation)
+                # Pixel data that was not decoded yet is still described by its tiles
+                self.assertTrue(self.processor.source_image.tile)
+                self.assertIsNone(self.processor.current_image)
+                
+                self.processor.get_pixel(0, 0)
+                self.assertEqual(self.processor.current_image.mode, "L")
+
+    def test_exif_orientation(self):
+        """Test that EXIF orientation is applied to dimensions and pixels."""
+        # Stored 40x20 with a white left half; orientation 6 turns it 90 degrees clockwise
+        image = Image.new("L", (40, 20), 0)
+        image.paste(255, (0, 0, 20, 20))
+        exif = Image.Exif()
+        exif[ImageProcessor.EXIF_ORIENTATION] = 6
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = os.path.join(temp_dir, "rotated.jpg")
+            image.save(filename, exif=exif, quality=95)
+            self.processor.load_image(filename)
+            
+            self.assertEqual(self.processor.get_image_dimensions(), (20, 40))
+            self.assertEqual(self.processor.get_image_info()["orientation"], 6)
+            
+            # The white half is now at the top
+            self.assertGreater(self.processor.get_pixel(10, 5), 200)
+            self.assertLess(self.processor.get_pixel(10, 35), 50)
+            self.assertEqual(self.processor.get_image_dimensions(), (20, 40))
+
+    def test_all_exif_orientations(self):
+        """Test that every EXIF orientation maps pixels like a full-size transpose."""
+        # Every pixel has its own value, so any misplaced pixel is noticed
+        image = Image.frombytes("L", (6, 4), bytes(range(0, 240, 10)))
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for orientation, transpose in ImageProcessor.ORIENTATION_TRANSPOSE.items():
+                exif = Image.Exif()
+                exif[ImageProcessor.EXIF_ORIENTATION] = orientation
+                filename = os.path.join(temp_dir, f"oriented{orientation}.png")
+                image.save(filename, exif=exif)
+                self.processor.load_image(filename)
+                
+                expected = image.transpose(transpose)
+                self.assertEqual(self.processor.get_image_dimensions(), expected.size)
+                self.assertEqual(self.processor.get_grayscale_buffer(*expected.size), expected.tobytes())
+                self.assertEqual(self.processor.get_grayscale_image().tobytes(), expected.tobytes())
+                for y in range(expected.height):
+                    for x in range(expected.width):
+                        self.assertEqual(self.processor.get_pixel(x, y), expected.getpixel((x, y)))
+
     def test_pixel_access(self):
         """Test pixel access functionality."""
         self.processor.load_image(self.test_image)